@@ -1,9 +1,8 @@
+use anyhow::Context;
 use clap::Parser;
 use coltec_daemon::{workspace_schema, WorkspaceSpec};
 use jsonschema::{Draft, JSONSchema};
 use serde_json::Value;
-use std::fs::File;
-use std::io::Read;
 use std::path::PathBuf;
 
 /// Validate a workspace-spec YAML against the generated JSON Schema and semantic invariants.
@@ -28,10 +27,8 @@ struct Args {
 }
 
 fn load_json_schema(schema_path: &PathBuf) -> anyhow::Result<Value> {
-    let mut f = File::open(schema_path)?;
-    let mut buf = String::new();
-    f.read_to_string(&mut buf)?;
-    let json: Value = serde_json::from_str(&buf)?;
+    let buf = std::fs::read(schema_path)?;
+    let json: Value = serde_json::from_slice(&buf)?;
     Ok(json)
 }
 
@@ -64,8 +61,8 @@ fn main() -> anyhow::Result<()> {
         .with_draft(Draft::Draft7)
         .compile(schema_ref)?;
 
-    let file_content = std::fs::read_to_string(&file)?;
-    let data: Value = serde_yaml::from_str(&file_content)?;
+    let file_content = std::fs::read(&file)?;
+    let data: Value = serde_yaml::from_slice(&file_content)?;
 
     // Step 1: JSON Schema validation
     let result = compiled.validate(&data);
@@ -89,7 +86,10 @@ fn main() -> anyhow::Result<()> {
 
     // Step 2: Semantic validation (unless --schema-only)
     if !args.schema_only {
-        let spec: WorkspaceSpec = serde_yaml::from_str(&file_content)?;
+        // Parse the YAML again for the typed pass: serde_yaml errors carry the field path
+        // and line/column, which a Value-based deserialize would lose.
+        let spec: WorkspaceSpec = serde_yaml::from_slice(&file_content)
+            .with_context(|| format!("failed to parse {}", file.display()))?;
 
         if let Err(err) = spec.validate_semantics() {
             eprintln!("✗ semantic error: {}", file.display());
@@ -43,10 +43,28 @@ pub struct Args {
     #[arg(long)]
     pub validate_only: bool,
 
-    /// Override sync interval for all paths (seconds)
-    #[arg(long, env = "COLTEC_INTERVAL")]
+    /// Override sync interval for all paths (seconds, minimum 10)
+    #[arg(
+        long,
+        env = "COLTEC_INTERVAL",
+        value_parser = clap::value_parser!(u64).range(10..)
+    )]
     pub interval: Option<u64>,
 
+    /// Maximum number of same-priority sync actions to run at once (default: 1, sequential).
+    ///
+    /// rclone's transfers, checkers and bwlimit apply per process, so N concurrent
+    /// syncs can use up to N times those limits. Actions whose local paths, or
+    /// whose paths on the same remote, nest inside one another never run at the
+    /// same time.
+    #[arg(
+        long,
+        default_value_t = 1,
+        env = "COLTEC_MAX_CONCURRENT_SYNCS",
+        value_parser = clap::value_parser!(u32).range(1..)
+    )]
+    pub max_concurrent_syncs: u32,
+
     /// Sync only specific paths by name (can be repeated)
     #[arg(long = "only", value_name = "NAME")]
     pub only_paths: Vec<String>,
@@ -113,6 +131,26 @@ mod tests {
         assert_eq!(args.interval, Some(60));
     }
 
+    #[test]
+    fn test_interval_override_below_minimum_rejected() {
+        // Matches the spec's 10s floor; 0 would make the daemon sync back to back
+        assert!(Args::try_parse_from(["coltec-daemon", "--interval", "0"]).is_err());
+        assert!(Args::try_parse_from(["coltec-daemon", "--interval", "9"]).is_err());
+        let args = Args::parse_from(["coltec-daemon", "--interval", "10"]);
+        assert_eq!(args.interval, Some(10));
+    }
+
+    #[test]
+    fn test_max_concurrent_syncs() {
+        let args = Args::parse_from(["coltec-daemon"]);
+        assert_eq!(args.max_concurrent_syncs, 1);
+
+        let args = Args::parse_from(["coltec-daemon", "--max-concurrent-syncs", "4"]);
+        assert_eq!(args.max_concurrent_syncs, 4);
+
+        assert!(Args::try_parse_from(["coltec-daemon", "--max-concurrent-syncs", "0"]).is_err());
+    }
+
     #[test]
     fn test_only_paths() {
         let args = Args::parse_from(["coltec-daemon", "--only", "workspace", "--only", "config"]);
@@ -6,7 +6,7 @@
 //! - Remote references must exist in the remotes map
 //! - Crypt remotes require proper configuration
 
-use crate::{PersistenceMode, WorkspaceSpec};
+use crate::{PersistenceMode, PersistenceSpec, WorkspaceSpec};
 use anyhow::Context;
 use std::collections::HashSet;
 use std::path::Path;
@@ -64,29 +64,36 @@ pub enum ConfigError {
     NoRemotesConfigured,
 }
 
+impl PersistenceSpec {
+    /// Returns true if there is anything to sync (sync paths or environment volumes).
+    fn has_sync_targets(&self) -> bool {
+        !self.sync.is_empty()
+            || self
+                .multi_scope_volumes
+                .as_ref()
+                .is_some_and(|v| !v.environment.is_empty())
+    }
+}
+
 impl WorkspaceSpec {
     /// Validate semantic invariants beyond JSON Schema.
     ///
     /// Call this after deserializing to catch configuration errors
     /// that JSON Schema cannot express.
     pub fn validate_semantics(&self) -> Result<(), ConfigError> {
+        let has_sync_targets = self.persistence.has_sync_targets();
+
         // Invariant 1: replicated mode requires sync paths
-        if self.persistence.enabled && matches!(self.persistence.mode, PersistenceMode::Replicated)
+        if self.persistence.enabled
+            && matches!(self.persistence.mode, PersistenceMode::Replicated)
+            && !has_sync_targets
         {
-            let has_sync_paths = !self.persistence.sync.is_empty();
-            let has_env_volumes = self
-                .persistence
-                .multi_scope_volumes
-                .as_ref()
-                .map(|v| !v.environment.is_empty())
-                .unwrap_or(false);
-
-            if !has_sync_paths && !has_env_volumes {
-                return Err(ConfigError::ReplicatedRequiresSyncPaths);
-            }
+            return Err(ConfigError::ReplicatedRequiresSyncPaths);
         }
 
-        // Invariant 2: sync intervals must be >= 10s
+        // Invariants 2 + 3: sync intervals must be >= 10s and sync path names unique,
+        // checked in a single pass over the sync paths
+        let mut seen_sync = HashSet::with_capacity(self.persistence.sync.len());
         for sp in &self.persistence.sync {
             if sp.interval < 10 {
                 return Err(ConfigError::SyncIntervalTooLow {
@@ -94,10 +101,14 @@ impl WorkspaceSpec {
                     interval: sp.interval,
                 });
             }
+            if !seen_sync.insert(&sp.name) {
+                return Err(ConfigError::DuplicateSyncPathName(sp.name.clone()));
+            }
         }
 
-        // Also check multi_scope_volumes.environment intervals
+        // Same for multi_scope_volumes.environment: intervals >= 10s, unique volume names
         if let Some(msv) = &self.persistence.multi_scope_volumes {
+            let mut seen_vol = HashSet::with_capacity(msv.environment.len());
             for vol in &msv.environment {
                 if vol.interval < 10 {
                     return Err(ConfigError::VolumeIntervalTooLow {
@@ -105,21 +116,6 @@ impl WorkspaceSpec {
                         interval: vol.interval,
                     });
                 }
-            }
-        }
-
-        // Invariant 3: no duplicate sync path names
-        let mut seen_sync = HashSet::new();
-        for sp in &self.persistence.sync {
-            if !seen_sync.insert(&sp.name) {
-                return Err(ConfigError::DuplicateSyncPathName(sp.name.clone()));
-            }
-        }
-
-        // Invariant 5: no duplicate volume names
-        if let Some(msv) = &self.persistence.multi_scope_volumes {
-            let mut seen_vol = HashSet::new();
-            for vol in &msv.environment {
                 if !seen_vol.insert(&vol.name) {
                     return Err(ConfigError::DuplicateVolumeName(vol.name.clone()));
                 }
@@ -127,26 +123,18 @@ impl WorkspaceSpec {
         }
 
         // --- Remote validation (Option 2 - Named remotes) ---
-        self.validate_remotes()?;
+        // Remotes only matter when there is something to sync
+        if has_sync_targets {
+            self.validate_remotes()?;
+        }
 
         Ok(())
     }
 
     /// Validate remote configuration.
+    ///
+    /// Only called when the spec has sync paths or environment volumes.
     fn validate_remotes(&self) -> Result<(), ConfigError> {
-        let has_sync_paths = !self.persistence.sync.is_empty();
-        let has_env_volumes = self
-            .persistence
-            .multi_scope_volumes
-            .as_ref()
-            .map(|v| !v.environment.is_empty())
-            .unwrap_or(false);
-
-        // If no sync paths, skip remote validation
-        if !has_sync_paths && !has_env_volumes {
-            return Ok(());
-        }
-
         // Must have named remotes if there are sync paths
         if self.persistence.remotes.is_empty() {
             return Err(ConfigError::NoRemotesConfigured);
@@ -220,10 +208,11 @@ impl WorkspaceSpec {
 ///
 /// This is the primary entry point for loading configuration.
 pub fn load_and_validate(path: &Path) -> anyhow::Result<WorkspaceSpec> {
-    let content = std::fs::read_to_string(path)
-        .with_context(|| format!("failed to read {}", path.display()))?;
+    // Parse straight from bytes; the YAML parser validates UTF-8 itself.
+    let content =
+        std::fs::read(path).with_context(|| format!("failed to read {}", path.display()))?;
 
-    let spec: WorkspaceSpec = serde_yaml::from_str(&content)
+    let spec: WorkspaceSpec = serde_yaml::from_slice(&content)
         .with_context(|| format!("failed to parse YAML in {}", path.display()))?;
 
     spec.validate_semantics()
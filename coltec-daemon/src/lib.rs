@@ -10,7 +10,7 @@ pub mod sync;
 pub use config::{load_and_validate, ConfigError};
 pub use plan::{build_plan, OperationSettings, PlanContext, ResolvedRemote, SyncAction, SyncPlan};
 pub use schemars::schema_for;
-pub use sync::{execute_plan, execute_sync, PlanResult, SyncResult};
+pub use sync::{execute_actions, execute_plan, execute_sync, PlanResult, SyncResult};
 
 pub fn workspace_schema() -> schemars::schema::RootSchema {
     schema_for!(WorkspaceSpec)
@@ -51,6 +51,17 @@ pub enum FilenameEncryption {
     Off,
 }
 
+impl FilenameEncryption {
+    /// The rclone option value for this mode.
+    pub fn as_str(&self) -> &'static str {
+        match self {
+            FilenameEncryption::Standard => "standard",
+            FilenameEncryption::Obfuscate => "obfuscate",
+            FilenameEncryption::Off => "off",
+        }
+    }
+}
+
 /// Encryption configuration for rclone crypt remotes.
 #[derive(Debug, Clone, Serialize, Deserialize, JsonSchema)]
 #[serde(deny_unknown_fields)]
@@ -10,13 +10,15 @@
 use anyhow::Result;
 use clap::Parser;
 use tokio::sync::watch;
-use tokio::time::{interval, Duration};
+use tokio::time::{sleep_until, Duration, Instant};
 use tracing::{debug, error, info, warn};
 
 mod cli;
 
 use cli::{Args, LogFormat};
-use coltec_daemon::{build_plan, execute_plan, load_and_validate, SyncPlan};
+use coltec_daemon::{
+    build_plan, execute_actions, execute_plan, load_and_validate, SyncAction, SyncPlan,
+};
 
 /// Exit codes following Unix conventions.
 mod exit_code {
@@ -126,21 +128,19 @@ async fn run(args: Args) -> Result<Option<ShutdownSignal>> {
     }
 
     // Build sync plan
-    let plan = build_plan(&spec, args.interval);
+    let mut plan = build_plan(&spec, args.interval);
 
     // Apply path filter if specified
-    let plan = if args.only_paths.is_empty() {
-        plan
-    } else {
-        let filtered = plan.filter_by_names(&args.only_paths);
+    if !args.only_paths.is_empty() {
+        let before = plan.actions.len();
+        plan.retain_by_names(&args.only_paths);
         info!(
             filter = ?args.only_paths,
-            before = plan.actions.len(),
-            after = filtered.actions.len(),
+            before,
+            after = plan.actions.len(),
             "filtered sync paths"
         );
-        filtered
-    };
+    }
 
     if plan.is_empty() {
         warn!("no sync actions in plan");
@@ -150,6 +150,7 @@ async fn run(args: Args) -> Result<Option<ShutdownSignal>> {
     info!(
         actions = plan.actions.len(),
         min_interval = plan.min_interval(),
+        max_concurrent = args.max_concurrent_syncs,
         "sync plan built"
     );
 
@@ -167,11 +168,13 @@ async fn run(args: Args) -> Result<Option<ShutdownSignal>> {
         );
     }
 
+    let max_concurrent = args.max_concurrent_syncs as usize;
+
     // Execute sync
     if args.once {
         // Single pass mode
         info!("running single sync pass");
-        let result = execute_plan(&plan, args.dry_run).await?;
+        let result = execute_plan(&plan, args.dry_run, max_concurrent).await?;
 
         if result.all_success() {
             info!(success = result.success_count, "single sync pass complete");
@@ -195,18 +198,21 @@ async fn run(args: Args) -> Result<Option<ShutdownSignal>> {
         Ok(None)
     } else {
         // Continuous mode with signal handling
-        let signal = run_continuous(plan, args.dry_run).await?;
+        let signal = run_continuous(plan, args.dry_run, max_concurrent).await?;
         Ok(Some(signal))
     }
 }
 
 /// Run the continuous sync loop with graceful shutdown on signals.
 /// Returns which signal caused the shutdown.
-async fn run_continuous(plan: SyncPlan, dry_run: bool) -> Result<ShutdownSignal> {
-    let interval_secs = plan.min_interval();
-
+async fn run_continuous(
+    plan: SyncPlan,
+    dry_run: bool,
+    max_concurrent: usize,
+) -> Result<ShutdownSignal> {
     info!(
-        interval_secs = interval_secs,
+        actions = plan.actions.len(),
+        min_interval_secs = plan.min_interval(),
         "starting continuous sync loop"
     );
 
@@ -214,7 +220,7 @@ async fn run_continuous(plan: SyncPlan, dry_run: bool) -> Result<ShutdownSignal>
     let (shutdown_tx, shutdown_rx) = watch::channel(false);
 
     // Spawn the sync loop
-    let sync_handle = tokio::spawn(sync_loop(plan, dry_run, interval_secs, shutdown_rx));
+    let sync_handle = tokio::spawn(sync_loop(plan, dry_run, max_concurrent, shutdown_rx));
 
     // Wait for shutdown signal
     let signal = wait_for_shutdown_signal().await;
@@ -241,30 +247,37 @@ async fn run_continuous(plan: SyncPlan, dry_run: bool) -> Result<ShutdownSignal>
 }
 
 /// The main sync loop - runs until shutdown signal received.
+///
+/// Each action keeps its own deadline. The loop sleeps until the earliest one
+/// and syncs only the actions that are due, so long-interval paths are not
+/// re-synced at the shortest interval in the plan.
 async fn sync_loop(
     plan: SyncPlan,
     dry_run: bool,
-    interval_secs: u64,
+    max_concurrent: usize,
     mut shutdown_rx: watch::Receiver<bool>,
 ) {
-    let mut ticker = interval(Duration::from_secs(interval_secs));
-
-    // Run first sync immediately
-    info!("running initial sync pass");
-    run_one_pass(&plan, dry_run).await;
+    // Every action is due immediately for the initial pass
+    let mut next_due = vec![Instant::now(); plan.actions.len()];
 
     loop {
+        let wake_at = next_due.iter().min().copied().unwrap_or_else(Instant::now);
+
         tokio::select! {
-            // Wait for next tick
-            _ = ticker.tick() => {
+            // Wait for the next deadline
+            _ = sleep_until(wake_at) => {
                 // Check if shutdown requested before starting sync
                 if *shutdown_rx.borrow() {
                     info!("shutdown requested, exiting loop");
                     break;
                 }
 
-                debug!("interval elapsed, starting sync pass");
-                run_one_pass(&plan, dry_run).await;
+                let started = Instant::now();
+                let due = due_actions(&plan, &next_due, started);
+                debug!(due = due.len(), "deadline reached, starting sync pass");
+                run_one_pass(&plan.workspace_name, &due, dry_run, max_concurrent).await;
+
+                rearm_deadlines(&plan, &mut next_due, started);
             }
 
             // Watch for shutdown signal
@@ -278,9 +291,36 @@ async fn sync_loop(
     }
 }
 
+/// Borrow the actions whose deadline has passed, in plan order.
+fn due_actions<'p>(plan: &'p SyncPlan, next_due: &[Instant], now: Instant) -> Vec<&'p SyncAction> {
+    plan.actions
+        .iter()
+        .zip(next_due)
+        .filter(|(_, deadline)| **deadline <= now)
+        .map(|(action, _)| action)
+        .collect()
+}
+
+/// Re-arm the deadlines of the actions that ran in the pass started at `started`.
+///
+/// Intervals are measured from the start of the pass. Actions that only became
+/// due while the pass was running keep their deadline and run next.
+fn rearm_deadlines(plan: &SyncPlan, next_due: &mut [Instant], started: Instant) {
+    for (action, deadline) in plan.actions.iter().zip(next_due.iter_mut()) {
+        if *deadline <= started {
+            *deadline = started + Duration::from_secs(action.interval_secs);
+        }
+    }
+}
+
 /// Run a single sync pass, logging results.
-async fn run_one_pass(plan: &SyncPlan, dry_run: bool) {
-    match execute_plan(plan, dry_run).await {
+async fn run_one_pass(
+    workspace: &str,
+    actions: &[&SyncAction],
+    dry_run: bool,
+    max_concurrent: usize,
+) {
+    match execute_actions(workspace, actions, dry_run, max_concurrent).await {
         Ok(result) => {
             if result.all_success() {
                 info!(success = result.success_count, "sync pass complete");
@@ -367,3 +407,87 @@ fn init_tracing(args: &Args) {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use coltec_daemon::{OperationSettings, SyncDirection};
+
+    fn plan_with_intervals(intervals: &[u64]) -> SyncPlan {
+        SyncPlan {
+            workspace_name: "test-workspace".to_string(),
+            actions: intervals
+                .iter()
+                .enumerate()
+                .map(|(i, &interval_secs)| SyncAction {
+                    name: format!("action-{}", i),
+                    local_path: format!("/data/{}", i),
+                    remote_path: format!("remote/{}", i),
+                    direction: SyncDirection::PushOnly,
+                    interval_secs,
+                    priority: 1,
+                    excludes: vec![],
+                    remote: None,
+                    operation: OperationSettings::default(),
+                })
+                .collect(),
+        }
+    }
+
+    fn names<'a>(actions: &[&'a SyncAction]) -> Vec<&'a str> {
+        actions.iter().map(|a| a.name.as_str()).collect()
+    }
+
+    #[test]
+    fn test_short_and_long_intervals_in_one_plan() {
+        let plan = plan_with_intervals(&[60, 300]);
+        let t0 = Instant::now();
+        let mut next_due = vec![t0; 2];
+        let mut passes = Vec::new();
+
+        // Drive the loop the way sync_loop does: wake at the earliest deadline,
+        // run what is due, re-arm
+        loop {
+            let wake_at = *next_due.iter().min().unwrap();
+            if wake_at > t0 + Duration::from_secs(600) {
+                break;
+            }
+            let due = due_actions(&plan, &next_due, wake_at);
+            passes.push(((wake_at - t0).as_secs(), names(&due).join(",")));
+            rearm_deadlines(&plan, &mut next_due, wake_at);
+        }
+
+        let expected: Vec<(u64, String)> = (0..=10)
+            .map(|i| {
+                let ran = if i % 5 == 0 {
+                    "action-0,action-1"
+                } else {
+                    "action-0"
+                };
+                (i * 60, ran.to_string())
+            })
+            .collect();
+        assert_eq!(passes, expected);
+    }
+
+    #[test]
+    fn test_action_due_during_pass_keeps_deadline() {
+        let plan = plan_with_intervals(&[60, 60]);
+        let started = Instant::now();
+        // action-1 falls due 5s into a pass that only ran action-0
+        let became_due = started + Duration::from_secs(5);
+        let mut next_due = vec![started, became_due];
+
+        assert_eq!(names(&due_actions(&plan, &next_due, started)), ["action-0"]);
+        rearm_deadlines(&plan, &mut next_due, started);
+
+        // action-1 is not pushed back a full interval; it runs on the next wake
+        assert_eq!(next_due[0], started + Duration::from_secs(60));
+        assert_eq!(next_due[1], became_due);
+        let after_pass = started + Duration::from_secs(10);
+        assert_eq!(
+            names(&due_actions(&plan, &next_due, after_pass)),
+            ["action-1"]
+        );
+    }
+}
@@ -4,7 +4,7 @@
 //! into a `SyncPlan` containing ordered `SyncAction`s ready for execution.
 
 use crate::{RcloneVolumeConfig, RemoteConfig, SyncDirection, SyncPath, WorkspaceSpec};
-use std::collections::BTreeMap;
+use std::collections::{BTreeMap, HashSet};
 
 /// Resolved operation settings for a sync action.
 #[derive(Debug, Clone, PartialEq, Default)]
@@ -95,19 +95,19 @@ impl SyncPlan {
 
     /// Filter actions to only include those with matching names.
     pub fn filter_by_names(&self, names: &[String]) -> SyncPlan {
+        let mut plan = self.clone();
+        plan.retain_by_names(names);
+        plan
+    }
+
+    /// Keep only actions with matching names, filtering in place without cloning.
+    pub fn retain_by_names(&mut self, names: &[String]) {
         if names.is_empty() {
-            return self.clone();
+            return;
         }
 
-        SyncPlan {
-            workspace_name: self.workspace_name.clone(),
-            actions: self
-                .actions
-                .iter()
-                .filter(|a| names.contains(&a.name))
-                .cloned()
-                .collect(),
-        }
+        let wanted: HashSet<&str> = names.iter().map(String::as_str).collect();
+        self.actions.retain(|a| wanted.contains(a.name.as_str()));
     }
 }
 
@@ -115,11 +115,11 @@ impl SyncPlan {
 #[derive(Debug, Clone)]
 pub struct PlanContext<'a> {
     /// Organization slug
-    pub org: String,
+    pub org: &'a str,
     /// Project slug
-    pub project: String,
+    pub project: &'a str,
     /// Environment (e.g., "dev", "staging")
-    pub env: String,
+    pub env: &'a str,
     /// Named remotes map (reference to spec)
     pub remotes: &'a BTreeMap<String, RemoteConfig>,
     /// Default remote name
@@ -132,9 +132,9 @@ impl<'a> PlanContext<'a> {
     /// Create context from a workspace spec.
     pub fn from_spec(spec: &'a WorkspaceSpec) -> Self {
         Self {
-            org: spec.metadata.org.clone(),
-            project: spec.metadata.project.clone(),
-            env: spec.metadata.environment.clone(),
+            org: &spec.metadata.org,
+            project: &spec.metadata.project,
+            env: &spec.metadata.environment,
             remotes: &spec.persistence.remotes,
             default_remote: spec.persistence.default_remote.as_ref(),
             defaults: spec.persistence.defaults.as_ref(),
@@ -142,11 +142,33 @@ impl<'a> PlanContext<'a> {
     }
 
     /// Resolve `{org}`, `{project}`, `{env}` placeholders in a template string.
+    ///
+    /// The template is scanned once; substituted values are not rescanned.
     pub fn resolve(&self, template: &str) -> String {
-        template
-            .replace("{org}", &self.org)
-            .replace("{project}", &self.project)
-            .replace("{env}", &self.env)
+        let mut out = String::with_capacity(template.len() + 32);
+        let mut rest = template;
+
+        while let Some(start) = rest.find('{') {
+            out.push_str(&rest[..start]);
+            let tail = &rest[start..];
+
+            let (value, len) = if tail.starts_with("{org}") {
+                (self.org, "{org}".len())
+            } else if tail.starts_with("{project}") {
+                (self.project, "{project}".len())
+            } else if tail.starts_with("{env}") {
+                (self.env, "{env}".len())
+            } else {
+                // Not a placeholder, keep the brace
+                ("{", 1)
+            };
+
+            out.push_str(value);
+            rest = &tail[len..];
+        }
+
+        out.push_str(rest);
+        out
     }
 
     /// Resolve a remote by name (recursively for crypt remotes).
@@ -173,7 +195,7 @@ impl<'a> PlanContext<'a> {
                 (
                     Some(crypt.password_env.clone()),
                     crypt.password2_env.clone(),
-                    Some(format!("{:?}", crypt.filename_encryption).to_lowercase()),
+                    Some(crypt.filename_encryption.as_str().to_string()),
                     Some(crypt.directory_name_encryption),
                 )
             } else {
@@ -256,6 +278,26 @@ pub fn build_plan(spec: &WorkspaceSpec, interval_override: Option<u64>) -> SyncP
     }
 }
 
+/// Resolve a remote path template, applying the remote's `path_prefix` if it has one.
+fn resolve_remote_path(
+    ctx: &PlanContext,
+    remote: Option<&ResolvedRemote>,
+    template: &str,
+) -> String {
+    let resolved = ctx.resolve(template);
+    match remote.and_then(|r| r.path_prefix.as_deref()) {
+        Some(prefix) => {
+            let prefix = prefix.trim_end_matches('/');
+            let mut path = String::with_capacity(prefix.len() + 1 + resolved.len());
+            path.push_str(prefix);
+            path.push('/');
+            path.push_str(&resolved);
+            path
+        }
+        None => resolved,
+    }
+}
+
 /// Convert a `SyncPath` to a `SyncAction`.
 fn sync_path_to_action(
     sp: &SyncPath,
@@ -271,19 +313,7 @@ fn sync_path_to_action(
     let operation = ctx.resolve_operation(sp.transfers, sp.checkers, sp.bwlimit.as_ref());
 
     // Apply path_prefix if remote has one
-    let remote_path = if let Some(ref r) = remote {
-        if let Some(ref prefix) = r.path_prefix {
-            format!(
-                "{}/{}",
-                prefix.trim_end_matches('/'),
-                ctx.resolve(&sp.remote_path)
-            )
-        } else {
-            ctx.resolve(&sp.remote_path)
-        }
-    } else {
-        ctx.resolve(&sp.remote_path)
-    };
+    let remote_path = resolve_remote_path(ctx, remote.as_ref(), &sp.remote_path);
 
     SyncAction {
         name: sp.name.clone(),
@@ -311,19 +341,7 @@ fn volume_to_action(
     let operation = ctx.resolve_operation(None, None, None);
 
     // Apply path_prefix if remote has one
-    let remote_path = if let Some(ref r) = remote {
-        if let Some(ref prefix) = r.path_prefix {
-            format!(
-                "{}/{}",
-                prefix.trim_end_matches('/'),
-                ctx.resolve(&vol.remote_path)
-            )
-        } else {
-            ctx.resolve(&vol.remote_path)
-        }
-    } else {
-        ctx.resolve(&vol.remote_path)
-    };
+    let remote_path = resolve_remote_path(ctx, remote.as_ref(), &vol.remote_path);
 
     SyncAction {
         name: vol.name.clone(),
@@ -346,9 +364,9 @@ mod tests {
     fn test_placeholder_resolution() {
         let empty_remotes = BTreeMap::new();
         let ctx = PlanContext {
-            org: "myorg".into(),
-            project: "myproj".into(),
-            env: "dev".into(),
+            org: "myorg",
+            project: "myproj",
+            env: "dev",
             remotes: &empty_remotes,
             default_remote: None,
             defaults: None,
@@ -363,6 +381,9 @@ mod tests {
 
         // No placeholders
         assert_eq!(ctx.resolve("static/path"), "static/path");
+
+        // Unknown or unterminated braces are kept as-is
+        assert_eq!(ctx.resolve("{other}/{org}/{"), "{other}/myorg/{");
     }
 
     #[test]
@@ -558,6 +579,15 @@ persistence:
         // Empty filter returns all
         let all = plan.filter_by_names(&[]);
         assert_eq!(all.actions.len(), 3);
+
+        // In-place variant keeps the same actions
+        let mut retained = plan.clone();
+        retained.retain_by_names(&["a".into(), "c".into()]);
+        assert_eq!(retained.actions, filtered.actions);
+
+        let mut unfiltered = plan.clone();
+        unfiltered.retain_by_names(&[]);
+        assert_eq!(unfiltered.actions.len(), 3);
     }
 
     #[test]
@@ -803,6 +833,7 @@ persistence:
             remote.password2_env,
             Some("RCLONE_CRYPT_PASSWORD2".to_string())
         );
+        assert_eq!(remote.filename_encryption, Some("standard".to_string()));
 
         // Check the wrapped remote is resolved
         assert!(remote.wrap_remote.is_some());
@@ -6,13 +6,18 @@
 //! - Building dynamic rclone config for named remotes
 //! - Handling errors and recoverable conditions
 //! - Retry with exponential backoff for transient failures
+//! - Optionally running same-priority actions concurrently
 //! - Health file updates for supervisor integration
 
 use crate::plan::{OperationSettings, ResolvedRemote, SyncAction, SyncPlan};
 use crate::SyncDirection;
 use anyhow::{Context, Result};
-use std::path::Path;
+use std::future::Future;
+use std::path::{Path, PathBuf};
+use std::pin::Pin;
 use std::process::Stdio;
+use std::sync::OnceLock;
+use std::task::Poll;
 use std::time::Duration;
 use tokio::process::Command;
 use tokio::time::sleep;
@@ -24,20 +29,31 @@ const DEFAULT_MAX_RETRIES: u32 = 3;
 /// Base delay for exponential backoff (doubles each retry).
 const RETRY_BASE_DELAY_MS: u64 = 1000;
 
+/// Root of all daemon state, resolved once per process.
+///
+/// Looking up the XDG base dirs reads the environment and the passwd database,
+/// so the result is cached rather than recomputed on every sync pass.
+fn state_root() -> &'static Path {
+    static ROOT: OnceLock<PathBuf> = OnceLock::new();
+    ROOT.get_or_init(|| {
+        directories::BaseDirs::new()
+            .map(|d| d.data_local_dir().join("coltec-daemon"))
+            .unwrap_or_else(|| PathBuf::from("/tmp/coltec-daemon"))
+    })
+}
+
 /// Get the state directory for a workspace.
 ///
 /// State is stored in `~/.local/share/coltec-daemon/{workspace}/`
 /// or `/tmp/coltec-daemon/{workspace}/` if XDG dirs unavailable.
-fn state_dir(workspace: &str) -> std::path::PathBuf {
-    directories::BaseDirs::new()
-        .map(|d| d.data_local_dir().join("coltec-daemon").join(workspace))
-        .unwrap_or_else(|| std::path::PathBuf::from("/tmp/coltec-daemon").join(workspace))
+fn state_dir(workspace: &str) -> PathBuf {
+    state_root().join(workspace)
 }
 
 /// Check if this is a first-time sync (needs --resync for bisync).
 pub async fn needs_resync(workspace: &str, action_name: &str) -> bool {
     let marker = state_dir(workspace).join(format!("{}.bisync", action_name));
-    !marker.exists()
+    !tokio::fs::try_exists(&marker).await.unwrap_or(false)
 }
 
 /// Mark a sync action as initialized (bisync state established).
@@ -72,7 +88,7 @@ pub struct HealthStatus {
 }
 
 /// Get the health file path for a workspace.
-pub fn health_file_path(workspace: &str) -> std::path::PathBuf {
+pub fn health_file_path(workspace: &str) -> PathBuf {
     state_dir(workspace).join("health.json")
 }
 
@@ -85,27 +101,18 @@ pub async fn update_health(workspace: &str, result: &PlanResult) -> Result<()> {
         .await
         .with_context(|| format!("failed to create state dir: {}", state.display()))?;
 
-    // Read existing health status
-    let mut status = if health_path.exists() {
-        let content = tokio::fs::read_to_string(&health_path).await.ok();
-        content
-            .and_then(|c| serde_json::from_str(&c).ok())
-            .unwrap_or(HealthStatus {
-                healthy: true,
-                last_success: None,
-                last_attempt: 0,
-                consecutive_failures: 0,
-                last_error: None,
-            })
-    } else {
-        HealthStatus {
+    // Read existing health status; a missing or unreadable file starts fresh
+    let mut status = tokio::fs::read(&health_path)
+        .await
+        .ok()
+        .and_then(|c| serde_json::from_slice(&c).ok())
+        .unwrap_or(HealthStatus {
             healthy: true,
             last_success: None,
             last_attempt: 0,
             consecutive_failures: 0,
             last_error: None,
-        }
-    };
+        });
 
     let now = std::time::SystemTime::now()
         .duration_since(std::time::UNIX_EPOCH)
@@ -156,57 +163,51 @@ fn build_rclone_backend(remote: &ResolvedRemote, remote_path: &str) -> String {
 /// Expand environment variable references in a string.
 ///
 /// Supports `${VAR}` and `$VAR` syntax. Unset variables are left unchanged.
+/// The input is scanned once; substituted values are not expanded again.
 fn expand_env_vars(value: &str) -> String {
-    let mut result = value.to_string();
-
-    // Handle ${VAR} syntax - use index-based iteration to avoid infinite loops
-    let mut search_start = 0;
-    while let Some(rel_start) = result[search_start..].find("${") {
-        let start = search_start + rel_start;
-        if let Some(rel_end) = result[start..].find('}') {
-            let end = start + rel_end;
-            let var_name = &result[start + 2..end];
-            match std::env::var(var_name) {
-                Ok(replacement) => {
-                    result = format!("{}{}{}", &result[..start], replacement, &result[end + 1..]);
-                    search_start = start + replacement.len();
-                }
-                Err(_) => {
-                    // Skip past this ${VAR} to avoid infinite loop
-                    search_start = end + 1;
-                }
-            }
-        } else {
-            break;
-        }
+    // Fast path: nothing to expand
+    if !value.contains('$') {
+        return value.to_string();
     }
 
-    // Handle $VAR syntax (only alphanumeric and underscore)
-    let mut i = 0;
-    while i < result.len() {
-        if result[i..].starts_with('$') && !result[i..].starts_with("${") {
-            let rest = &result[i + 1..];
-            let var_end = rest
-                .find(|c: char| !c.is_alphanumeric() && c != '_')
-                .unwrap_or(rest.len());
-            if var_end > 0 {
-                let var_name = &rest[..var_end];
-                match std::env::var(var_name) {
-                    Ok(replacement) => {
-                        result = format!("{}{}{}", &result[..i], replacement, &rest[var_end..]);
-                        i += replacement.len();
-                    }
-                    Err(_) => {
-                        // Skip past $VAR
-                        i += 1 + var_end;
-                    }
+    let mut result = String::with_capacity(value.len());
+    let mut rest = value;
+
+    while let Some(pos) = rest.find('$') {
+        result.push_str(&rest[..pos]);
+        let after = &rest[pos + 1..];
+
+        // Handle ${VAR} syntax
+        if let Some(braced) = after.strip_prefix('{') {
+            if let Some(end) = braced.find('}') {
+                match std::env::var(&braced[..end]) {
+                    Ok(replacement) => result.push_str(&replacement),
+                    // Keep the original ${VAR} text
+                    Err(_) => result.push_str(&rest[pos..pos + end + 3]),
                 }
+                rest = &braced[end + 1..];
                 continue;
             }
         }
-        i += 1;
+
+        // Handle $VAR syntax (only alphanumeric and underscore)
+        let var_end = after
+            .find(|c: char| !c.is_alphanumeric() && c != '_')
+            .unwrap_or(after.len());
+        if var_end > 0 {
+            match std::env::var(&after[..var_end]) {
+                Ok(replacement) => result.push_str(&replacement),
+                // Keep the original $VAR text
+                Err(_) => result.push_str(&rest[pos..pos + var_end + 1]),
+            }
+        } else {
+            // Lone `$` or unterminated `${`: keep the `$` literally
+            result.push('$');
+        }
+        rest = &after[var_end..];
     }
 
+    result.push_str(rest);
     result
 }
 
@@ -215,7 +216,8 @@ fn expand_env_vars(value: &str) -> String {
 /// Values with colons or commas need to be quoted. We use single quotes and
 /// double any internal single quotes per rclone's escaping rules.
 fn quote_rclone_value(value: &str) -> String {
-    if value.contains(':') || value.contains(',') || value.contains('\'') || value.contains('"') {
+    // One scan for any of the special characters
+    if value.contains([':', ',', '\'', '"']) {
         // Escape internal single quotes by doubling them
         let escaped = value.replace('\'', "''");
         format!("'{}'", escaped)
@@ -226,27 +228,28 @@ fn quote_rclone_value(value: &str) -> String {
 
 /// Build a storage backend connection string (s3, gcs, etc.)
 fn build_storage_backend(remote: &ResolvedRemote, remote_path: &str) -> String {
-    let mut opts = Vec::new();
+    // Written straight into one buffer: `:type[,key=value...]:path`
+    let mut backend = String::with_capacity(64 + remote_path.len());
+    backend.push(':');
+    backend.push_str(&remote.remote_type);
 
     // Add bucket if present
     if let Some(ref bucket) = remote.bucket {
-        let expanded = expand_env_vars(bucket);
-        opts.push(format!("bucket={}", quote_rclone_value(&expanded)));
+        backend.push_str(",bucket=");
+        backend.push_str(&quote_rclone_value(&expand_env_vars(bucket)));
     }
 
     // Add all backend-specific options, expanding env vars and quoting as needed
     for (key, value) in &remote.options {
-        let expanded = expand_env_vars(value);
-        opts.push(format!("{}={}", key, quote_rclone_value(&expanded)));
+        backend.push(',');
+        backend.push_str(key);
+        backend.push('=');
+        backend.push_str(&quote_rclone_value(&expand_env_vars(value)));
     }
 
-    let opts_str = if opts.is_empty() {
-        String::new()
-    } else {
-        format!(",{}", opts.join(","))
-    };
-
-    format!(":{}{}:{}", remote.remote_type, opts_str, remote_path)
+    backend.push(':');
+    backend.push_str(remote_path);
+    backend
 }
 
 /// Build a crypt backend connection string.
@@ -293,6 +296,23 @@ fn build_crypt_backend(remote: &ResolvedRemote, remote_path: &str) -> String {
     format!(":crypt,{}:{}", opts.join(","), remote_path)
 }
 
+/// Collect the crypt password environment for rclone from a resolved remote.
+///
+/// The spec names the env vars holding the passwords; unset vars are skipped.
+fn crypt_env_vars(remote: &ResolvedRemote) -> Vec<(&'static str, String)> {
+    if remote.remote_type != "crypt" {
+        return Vec::new();
+    }
+
+    [
+        ("RCLONE_CRYPT_PASSWORD", &remote.password_env),
+        ("RCLONE_CRYPT_PASSWORD2", &remote.password2_env),
+    ]
+    .into_iter()
+    .filter_map(|(key, var)| Some((key, std::env::var(var.as_ref()?).ok()?)))
+    .collect()
+}
+
 /// Apply operation settings to an rclone command.
 fn apply_operation_settings(cmd: &mut Command, settings: &OperationSettings) {
     if let Some(transfers) = settings.transfers {
@@ -327,27 +347,34 @@ pub struct SyncResult {
     pub attempts: u32,
 }
 
+/// Substrings of rclone stderr that mark a failure as transient.
+const RETRYABLE_ERROR_MARKERS: &[&str] = &[
+    // Network/connection errors
+    "connection reset",
+    "connection refused",
+    "timeout",
+    "temporary failure",
+    "network is unreachable",
+    "no such host",
+    "TLS handshake",
+    "EOF",
+    // S3/cloud provider transient errors
+    "503",
+    "500",
+    "429", // rate limit
+    "SlowDown",
+    "ServiceUnavailable",
+    "InternalError",
+    // Bisync lock contention
+    "lock file",
+    "locked",
+];
+
 /// Check if an rclone error is likely transient and worth retrying.
 fn is_retryable_error(stderr: &str) -> bool {
-    // Network/connection errors
-    stderr.contains("connection reset")
-        || stderr.contains("connection refused")
-        || stderr.contains("timeout")
-        || stderr.contains("temporary failure")
-        || stderr.contains("network is unreachable")
-        || stderr.contains("no such host")
-        || stderr.contains("TLS handshake")
-        || stderr.contains("EOF")
-        // S3/cloud provider transient errors
-        || stderr.contains("503")
-        || stderr.contains("500")
-        || stderr.contains("429") // rate limit
-        || stderr.contains("SlowDown")
-        || stderr.contains("ServiceUnavailable")
-        || stderr.contains("InternalError")
-        // Bisync lock contention
-        || stderr.contains("lock file")
-        || stderr.contains("locked")
+    RETRYABLE_ERROR_MARKERS
+        .iter()
+        .any(|marker| stderr.contains(marker))
 }
 
 /// Execute a single sync action with retry logic.
@@ -358,8 +385,11 @@ fn is_retryable_error(stderr: &str) -> bool {
 pub async fn execute_sync(action: &SyncAction, dry_run: bool, resync: bool) -> Result<SyncResult> {
     let result_name = action.name.clone();
 
-    // Check local path exists
-    if !Path::new(&action.local_path).exists() {
+    // Check local path exists (without blocking the runtime on a stat)
+    if !tokio::fs::try_exists(&action.local_path)
+        .await
+        .unwrap_or(false)
+    {
         warn!(path = %action.local_path, "local path does not exist, skipping");
         return Ok(SyncResult {
             name: result_name,
@@ -385,10 +415,17 @@ pub async fn execute_sync(action: &SyncAction, dry_run: bool, resync: bool) -> R
         }
     };
 
+    // Read crypt passwords once; they don't change between retries
+    let crypt_env = action
+        .remote
+        .as_ref()
+        .map(crypt_env_vars)
+        .unwrap_or_default();
+
     // Retry loop with exponential backoff
     let mut last_error: Option<String> = None;
     for attempt in 1..=DEFAULT_MAX_RETRIES {
-        match execute_sync_attempt(action, &remote_target, dry_run, resync).await {
+        match execute_sync_attempt(action, &remote_target, &crypt_env, dry_run, resync).await {
             Ok(()) => {
                 if attempt > 1 {
                     info!(attempt, "sync succeeded after retry");
@@ -469,6 +506,7 @@ enum SyncAttemptError {
 async fn execute_sync_attempt(
     action: &SyncAction,
     remote_target: &str,
+    crypt_env: &[(&'static str, String)],
     dry_run: bool,
     resync: bool,
 ) -> std::result::Result<(), SyncAttemptError> {
@@ -476,22 +514,8 @@ async fn execute_sync_attempt(
 
     let mut cmd = Command::new("rclone");
 
-    // Set up environment variables for crypt passwords if needed
-    if let Some(ref resolved) = action.remote {
-        if resolved.remote_type == "crypt" {
-            if let Some(ref pw_env) = resolved.password_env {
-                // Check if the env var is set, pass through to rclone
-                if let Ok(pw) = std::env::var(pw_env) {
-                    cmd.env("RCLONE_CRYPT_PASSWORD", pw);
-                }
-            }
-            if let Some(ref pw2_env) = resolved.password2_env {
-                if let Ok(pw2) = std::env::var(pw2_env) {
-                    cmd.env("RCLONE_CRYPT_PASSWORD2", pw2);
-                }
-            }
-        }
-    }
+    // Pass through crypt passwords, if any
+    cmd.envs(crypt_env.iter().map(|(k, v)| (k, v)));
 
     // Choose sync mode based on direction
     match action.direction {
@@ -532,12 +556,15 @@ async fn execute_sync_attempt(
 
     debug!(cmd = ?cmd, "executing rclone command");
 
-    let output = match cmd
-        .stdout(Stdio::piped())
-        .stderr(Stdio::piped())
-        .output()
-        .await
-    {
+    // stdout is only ever logged at debug level; don't pipe and buffer it otherwise.
+    // stderr is always captured for error classification.
+    let stdout = if tracing::enabled!(tracing::Level::DEBUG) {
+        Stdio::piped()
+    } else {
+        Stdio::null()
+    };
+
+    let output = match cmd.stdout(stdout).stderr(Stdio::piped()).output().await {
         Ok(output) => output,
         Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
             return Err(SyncAttemptError::NotRetryable(
@@ -553,15 +580,15 @@ async fn execute_sync_attempt(
         }
     };
 
-    let stdout = String::from_utf8_lossy(&output.stdout);
-    let stderr = String::from_utf8_lossy(&output.stderr);
-
-    if !stdout.is_empty() {
-        debug!(stdout = %stdout, "rclone stdout");
+    if !output.stdout.is_empty() {
+        debug!(stdout = %String::from_utf8_lossy(&output.stdout), "rclone stdout");
     }
 
     if !output.status.success() {
-        let stderr_str = stderr.to_string();
+        // Take ownership of the captured bytes; only invalid UTF-8 needs a lossy copy.
+        let exit_code = output.status.code();
+        let stderr = String::from_utf8(output.stderr)
+            .unwrap_or_else(|e| String::from_utf8_lossy(e.as_bytes()).into_owned());
 
         // Check for known recoverable errors (not retryable, just skip)
         if stderr.contains("directory not found") || stderr.contains("does not exist") {
@@ -577,16 +604,16 @@ async fn execute_sync_attempt(
 
         error!(
             stderr = %stderr,
-            exit_code = ?output.status.code(),
+            exit_code = ?exit_code,
             "rclone failed"
         );
 
         // Check if this error is retryable
-        if is_retryable_error(&stderr_str) {
-            return Err(SyncAttemptError::Retryable(stderr_str));
+        if is_retryable_error(&stderr) {
+            return Err(SyncAttemptError::Retryable(stderr));
         }
 
-        return Err(SyncAttemptError::NotRetryable(stderr_str));
+        return Err(SyncAttemptError::NotRetryable(stderr));
     }
 
     Ok(())
@@ -610,39 +637,140 @@ impl PlanResult {
     }
 }
 
-/// Execute all actions in a sync plan.
-#[instrument(skip_all, fields(workspace = %plan.workspace_name, actions = plan.actions.len()))]
-pub async fn execute_plan(plan: &SyncPlan, dry_run: bool) -> Result<PlanResult> {
-    let mut results = Vec::with_capacity(plan.actions.len());
-    let mut success_count = 0;
-    let mut failure_count = 0;
-
-    for action in &plan.actions {
-        // Check if we need resync (first-time bisync)
-        let resync = if action.direction == SyncDirection::Bidirectional {
-            needs_resync(&plan.workspace_name, &action.name).await
-        } else {
-            false
-        };
+/// Run a single action end to end: resync detection, sync, and marker update.
+async fn run_action(workspace: &str, action: &SyncAction, dry_run: bool) -> Result<SyncResult> {
+    // Check if we need resync (first-time bisync)
+    let resync = if action.direction == SyncDirection::Bidirectional {
+        needs_resync(workspace, &action.name).await
+    } else {
+        false
+    };
 
-        let result = execute_sync(action, dry_run, resync).await?;
+    let result = execute_sync(action, dry_run, resync).await?;
 
-        // Mark as initialized if successful and was a resync
-        if result.success && result.was_resync && !dry_run {
-            if let Err(e) = mark_initialized(&plan.workspace_name, &action.name).await {
-                warn!(error = %e, action = %action.name, "failed to mark sync as initialized");
+    // Mark as initialized if successful and was a resync
+    if result.success && result.was_resync && !dry_run {
+        if let Err(e) = mark_initialized(workspace, &action.name).await {
+            warn!(error = %e, action = %action.name, "failed to mark sync as initialized");
+        }
+    }
+
+    Ok(result)
+}
+
+/// Returns true if one path is the same as, or nested inside, the other.
+fn paths_overlap(a: &str, b: &str) -> bool {
+    let (a, b) = (Path::new(a), Path::new(b));
+    a.starts_with(b) || b.starts_with(a)
+}
+
+/// Returns true if two actions must not sync at the same time.
+///
+/// That is the case when their local trees overlap, or when they target
+/// overlapping paths on the same remote.
+fn actions_conflict(a: &SyncAction, b: &SyncAction) -> bool {
+    if paths_overlap(&a.local_path, &b.local_path) {
+        return true;
+    }
+    let same_remote = a.remote.as_ref().map(|r| &r.name) == b.remote.as_ref().map(|r| &r.name);
+    same_remote && paths_overlap(&a.remote_path, &b.remote_path)
+}
+
+/// Wait for the first in-flight action to finish and remove it from `running`.
+///
+/// The futures are polled in place on the calling task; each one mostly waits on
+/// its rclone child process, so there is nothing to gain from spawning them.
+async fn next_finished<Fut: Future>(
+    running: &mut Vec<(usize, Pin<Box<Fut>>)>,
+) -> (usize, Fut::Output) {
+    debug_assert!(!running.is_empty());
+    std::future::poll_fn(|cx| {
+        for i in 0..running.len() {
+            if let Poll::Ready(output) = running[i].1.as_mut().poll(cx) {
+                let (idx, _) = running.swap_remove(i);
+                return Poll::Ready((idx, output));
             }
         }
+        Poll::Pending
+    })
+    .await
+}
 
-        if result.success {
-            success_count += 1;
-        } else {
-            failure_count += 1;
+/// Run actions through `run`, honoring priority order and the concurrency limit.
+///
+/// With a limit of 1 this is a plain loop over the actions in plan order. Above
+/// that, each group of equal-priority actions finishes before the next priority
+/// starts, and within a group up to `max_concurrent` actions run at once. An
+/// action never starts while a conflicting one (see `actions_conflict`) is still
+/// running. Results keep plan order.
+async fn run_actions<'a, F, Fut>(
+    actions: &[&'a SyncAction],
+    max_concurrent: usize,
+    run: F,
+) -> Result<Vec<SyncResult>>
+where
+    F: Fn(&'a SyncAction) -> Fut,
+    Fut: Future<Output = Result<SyncResult>>,
+{
+    let mut results = Vec::with_capacity(actions.len());
+
+    if max_concurrent <= 1 {
+        for &action in actions {
+            results.push(run(action).await?);
+        }
+        return Ok(results);
+    }
+
+    for group in actions.chunk_by(|a, b| a.priority == b.priority) {
+        let mut slots: Vec<Option<SyncResult>> = (0..group.len()).map(|_| None).collect();
+        // In-flight actions, keyed by their index within the group
+        let mut running = Vec::new();
+
+        for (idx, &action) in group.iter().enumerate() {
+            // Wait for a free slot and for any conflicting action to finish
+            while running.len() >= max_concurrent
+                || running
+                    .iter()
+                    .any(|(r, _)| actions_conflict(group[*r], action))
+            {
+                let (done, result) = next_finished(&mut running).await;
+                slots[done] = Some(result?);
+            }
+
+            running.push((idx, Box::pin(run(action))));
+        }
+
+        while !running.is_empty() {
+            let (done, result) = next_finished(&mut running).await;
+            slots[done] = Some(result?);
         }
 
-        results.push(result);
+        results.extend(slots.into_iter().flatten());
     }
 
+    Ok(results)
+}
+
+/// Execute the given actions of a workspace's plan.
+///
+/// Actions run in the order given (plan order is priority order). With
+/// `max_concurrent` above 1, non-conflicting same-priority actions may run in
+/// parallel; see `run_actions`.
+#[instrument(skip_all, fields(workspace = %workspace, actions = actions.len()))]
+pub async fn execute_actions(
+    workspace: &str,
+    actions: &[&SyncAction],
+    dry_run: bool,
+    max_concurrent: usize,
+) -> Result<PlanResult> {
+    let results = run_actions(actions, max_concurrent, |action| {
+        run_action(workspace, action, dry_run)
+    })
+    .await?;
+
+    let success_count = results.iter().filter(|r| r.success).count();
+    let failure_count = results.len() - success_count;
+
     info!(
         success = success_count,
         failed = failure_count,
@@ -656,6 +784,16 @@ pub async fn execute_plan(plan: &SyncPlan, dry_run: bool) -> Result<PlanResult>
     })
 }
 
+/// Execute all actions in a sync plan.
+pub async fn execute_plan(
+    plan: &SyncPlan,
+    dry_run: bool,
+    max_concurrent: usize,
+) -> Result<PlanResult> {
+    let actions: Vec<&SyncAction> = plan.actions.iter().collect();
+    execute_actions(&plan.workspace_name, &actions, dry_run, max_concurrent).await
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -694,6 +832,236 @@ mod tests {
         let _ = tokio::fs::remove_dir_all(&state).await;
     }
 
+    fn test_action(name: &str, local_path: &str, priority: u8) -> SyncAction {
+        SyncAction {
+            name: name.to_string(),
+            local_path: local_path.to_string(),
+            remote_path: name.to_string(),
+            direction: SyncDirection::PushOnly,
+            interval_secs: 60,
+            priority,
+            excludes: vec![],
+            remote: None,
+            operation: OperationSettings::default(),
+        }
+    }
+
+    #[tokio::test]
+    async fn test_execute_plan_keeps_plan_order() {
+        // Missing local paths are skipped without spawning rclone
+        let plan = SyncPlan {
+            workspace_name: "test-workspace".to_string(),
+            actions: (0..7)
+                .map(|i| {
+                    let name = format!("action-{}", i);
+                    let local = format!("/nonexistent/coltec-daemon-test/{}", name);
+                    test_action(&name, &local, (i / 3) as u8)
+                })
+                .collect(),
+        };
+
+        let result = execute_plan(&plan, true, 4).await.unwrap();
+        assert!(result.all_success());
+        assert_eq!(result.success_count, 7);
+        let names: Vec<_> = result.results.iter().map(|r| r.name.as_str()).collect();
+        let expected: Vec<_> = plan.actions.iter().map(|a| a.name.as_str()).collect();
+        assert_eq!(names, expected);
+    }
+
+    fn with_remote(mut action: SyncAction, remote: &str, remote_path: &str) -> SyncAction {
+        action.remote = Some(ResolvedRemote {
+            name: remote.to_string(),
+            remote_type: "s3".to_string(),
+            bucket: Some("bucket".to_string()),
+            path_prefix: None,
+            options: BTreeMap::new(),
+            wrap_remote: None,
+            wrap_path: None,
+            password_env: None,
+            password2_env: None,
+            filename_encryption: None,
+            directory_name_encryption: None,
+        });
+        action.remote_path = remote_path.to_string();
+        action
+    }
+
+    /// Records what a fake runner saw while `run_actions` drove it.
+    #[derive(Default)]
+    struct RunTracker {
+        /// Actions currently running
+        active: Vec<SyncAction>,
+        /// Highest number of actions seen running at once
+        max_active: usize,
+        /// Whether two conflicting actions ever ran at once
+        conflicted: bool,
+        /// "start:<name>" / "end:<name>" in the order they happened
+        events: Vec<String>,
+    }
+
+    /// Fake action runner that holds each action open long enough to overlap.
+    async fn tracked_run(
+        tracker: &std::sync::Mutex<RunTracker>,
+        action: &SyncAction,
+    ) -> Result<SyncResult> {
+        {
+            let mut t = tracker.lock().unwrap();
+            if t.active.iter().any(|a| actions_conflict(a, action)) {
+                t.conflicted = true;
+            }
+            t.active.push(action.clone());
+            t.max_active = t.max_active.max(t.active.len());
+            t.events.push(format!("start:{}", action.name));
+        }
+
+        sleep(Duration::from_millis(20)).await;
+
+        {
+            let mut t = tracker.lock().unwrap();
+            t.active.retain(|a| a.name != action.name);
+            t.events.push(format!("end:{}", action.name));
+        }
+
+        Ok(SyncResult {
+            name: action.name.clone(),
+            success: true,
+            error: None,
+            was_resync: false,
+            attempts: 1,
+        })
+    }
+
+    /// Drive `run_actions` over `actions` with the tracking runner.
+    async fn track(actions: &[SyncAction], max_concurrent: usize) -> (Vec<String>, RunTracker) {
+        let tracker = std::sync::Mutex::new(RunTracker::default());
+        let refs: Vec<&SyncAction> = actions.iter().collect();
+        let results = run_actions(&refs, max_concurrent, |a| tracked_run(&tracker, a))
+            .await
+            .unwrap();
+        let names = results.into_iter().map(|r| r.name).collect();
+        (names, tracker.into_inner().unwrap())
+    }
+
+    #[tokio::test]
+    async fn test_run_actions_concurrent_within_priority() {
+        let actions = vec![
+            test_action("a", "/data/a", 1),
+            test_action("b", "/data/b", 1),
+            test_action("c", "/data/c", 2),
+            test_action("d", "/data/d", 2),
+            test_action("e", "/data/e", 2),
+        ];
+        let (names, t) = track(&actions, 4).await;
+
+        // Plan order is preserved regardless of completion order
+        assert_eq!(names, ["a", "b", "c", "d", "e"]);
+
+        // The priority-2 group ran all three actions at once
+        assert_eq!(t.max_active, 3);
+        assert!(!t.conflicted);
+
+        // Every priority-1 action finished before any priority-2 action started
+        let pos = |event: &str| t.events.iter().position(|e| e == event).unwrap();
+        let last_p1_end = pos("end:a").max(pos("end:b"));
+        let first_p2_start = pos("start:c").min(pos("start:d")).min(pos("start:e"));
+        assert!(last_p1_end < first_p2_start);
+    }
+
+    #[tokio::test]
+    async fn test_run_actions_serializes_overlapping_local_paths() {
+        let actions = vec![
+            test_action("workspace", "/workspace", 2),
+            test_action("scratch", "/workspace/scratch", 2),
+            test_action("other", "/other", 2),
+        ];
+        let (names, t) = track(&actions, 4).await;
+
+        assert_eq!(names, ["workspace", "scratch", "other"]);
+        assert!(!t.conflicted, "nested local paths must not sync at once");
+        // "other" is disjoint from "scratch", so those two may still overlap
+        assert_eq!(t.max_active, 2);
+    }
+
+    #[tokio::test]
+    async fn test_run_actions_serializes_overlapping_remote_paths() {
+        let actions = vec![
+            with_remote(
+                test_action("workspace", "/workspace", 2),
+                "primary",
+                "proj/ws",
+            ),
+            with_remote(
+                test_action("cache", "/cache", 2),
+                "primary",
+                "proj/ws/cache",
+            ),
+            with_remote(test_action("other", "/other", 2), "primary", "proj/other"),
+            // Same remote path, but on a different remote
+            with_remote(test_action("mirror", "/mirror", 2), "secondary", "proj/ws"),
+        ];
+        let (names, t) = track(&actions, 4).await;
+
+        assert_eq!(names, ["workspace", "cache", "other", "mirror"]);
+        assert!(!t.conflicted, "nested remote paths must not sync at once");
+        // "cache" waits for "workspace"; "other" and "mirror" run alongside it
+        assert_eq!(t.max_active, 3);
+    }
+
+    #[tokio::test]
+    async fn test_run_actions_sequential_when_limit_is_one() {
+        let actions = vec![
+            test_action("a", "/data/a", 2),
+            test_action("b", "/data/b", 2),
+            test_action("c", "/data/c", 2),
+        ];
+        let (names, t) = track(&actions, 1).await;
+
+        assert_eq!(names, ["a", "b", "c"]);
+        assert_eq!(t.max_active, 1);
+    }
+
+    #[test]
+    fn test_paths_overlap() {
+        assert!(paths_overlap("/workspace", "/workspace/scratch"));
+        assert!(paths_overlap("/workspace/scratch", "/workspace"));
+        assert!(paths_overlap("/workspace", "/workspace"));
+        assert!(!paths_overlap("/workspace", "/workspace2"));
+        assert!(!paths_overlap("/data/a", "/data/b"));
+        assert!(paths_overlap("proj/ws", "proj/ws/cache"));
+    }
+
+    #[test]
+    fn test_actions_conflict() {
+        let ws = with_remote(test_action("ws", "/workspace", 2), "primary", "proj/ws");
+        let cache = with_remote(
+            test_action("cache", "/cache", 2),
+            "primary",
+            "proj/ws/cache",
+        );
+        let same_path = with_remote(test_action("dup", "/dup", 2), "primary", "proj/ws");
+        let other_remote = with_remote(test_action("mirror", "/mirror", 2), "secondary", "proj/ws");
+        let nested_local = with_remote(
+            test_action("scratch", "/workspace/scratch", 2),
+            "secondary",
+            "x",
+        );
+
+        assert!(actions_conflict(&ws, &cache));
+        assert!(actions_conflict(&ws, &same_path));
+        assert!(actions_conflict(&ws, &nested_local));
+        assert!(!actions_conflict(&ws, &other_remote));
+        assert!(!actions_conflict(&cache, &other_remote));
+    }
+
+    #[test]
+    fn test_is_retryable_error() {
+        assert!(is_retryable_error("dial tcp: connection refused"));
+        assert!(is_retryable_error("HTTP 503 ServiceUnavailable"));
+        assert!(is_retryable_error("bisync: lock file exists"));
+        assert!(!is_retryable_error("AccessDenied: invalid credentials"));
+        assert!(!is_retryable_error(""));
+    }
+
     #[test]
     fn test_build_storage_backend_minimal() {
         let remote = ResolvedRemote {
@@ -789,6 +1157,35 @@ mod tests {
         assert!(!args.contains(&std::ffi::OsStr::new("--bwlimit")));
     }
 
+    #[test]
+    fn test_crypt_env_vars() {
+        std::env::set_var("TEST_CRYPT_PW", "secret");
+        let mut remote = ResolvedRemote {
+            name: "encrypted".to_string(),
+            remote_type: "crypt".to_string(),
+            bucket: None,
+            path_prefix: None,
+            options: BTreeMap::new(),
+            wrap_remote: None,
+            wrap_path: None,
+            password_env: Some("TEST_CRYPT_PW".to_string()),
+            password2_env: Some("TEST_CRYPT_PW2_UNSET".to_string()),
+            filename_encryption: None,
+            directory_name_encryption: None,
+        };
+
+        // Unset salt var is skipped
+        assert_eq!(
+            crypt_env_vars(&remote),
+            vec![("RCLONE_CRYPT_PASSWORD", "secret".to_string())]
+        );
+
+        // Non-crypt remotes never get password env
+        remote.remote_type = "s3".to_string();
+        assert!(crypt_env_vars(&remote).is_empty());
+        std::env::remove_var("TEST_CRYPT_PW");
+    }
+
     #[test]
     fn test_expand_env_vars_braced() {
         std::env::set_var("TEST_VAR_BRACED", "expanded_value");
@@ -826,6 +1223,18 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_expand_env_vars_non_ascii_and_unterminated() {
+        std::env::set_var("TEST_VAR_MIXED", "ok");
+        assert_eq!(expand_env_vars("café-$TEST_VAR_MIXED"), "café-ok");
+        assert_eq!(
+            expand_env_vars("${TEST_VAR_MIXED $TEST_VAR_MIXED"),
+            "${TEST_VAR_MIXED ok"
+        );
+        assert_eq!(expand_env_vars("cost: 5$"), "cost: 5$");
+        std::env::remove_var("TEST_VAR_MIXED");
+    }
+
     #[test]
     fn test_quote_rclone_value_no_special_chars() {
         assert_eq!(quote_rclone_value("simple"), "simple");